@@ -2,7 +2,7 @@
 # S = (2 * g * m) / (rho_air * C_d * V^2)
 # D = = sqrt(S * 4 / pi)
 
-import numpy as np
+import math
 
 deployment_mode = str(input('Deployment mode? ("single" or "dual") '))
 safety_factor = float(input("Safety factor? (e.g. 1.1) "))
@@ -22,7 +22,7 @@ if deployment_mode == "single":
 
     # Computations
     S_total = round((2.0 * g * m) / (rho_air * C_d * V * V), 3)
-    D_total = round(np.sqrt(S_total * 4 / np.pi),1)
+    D_total = round(math.sqrt(S_total * 4.0 / math.pi), 1)
 
     S_total_ft2 = round(S_total * m2_to_ft2, 3)
     D_total_in = round(D_total * m_to_inch, 1)
@@ -49,7 +49,7 @@ else:
     C_d_avg = (C_d_drogue + C_d_main) / 2
 
     S_total = round((2.0 * g * m) / (rho_air * C_d_avg * V * V), 3)
-    D_total = round(np.sqrt(S_total * 4 / np.pi), 1)
+    D_total = round(math.sqrt(S_total * 4.0 / math.pi), 1)
 
     S_drogue = round(S_total * 0.2, 3)
     D_drogue = round(D_total * 0.2, 1)
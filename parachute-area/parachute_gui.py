@@ -18,6 +18,7 @@ Rounding:
 
 Dependencies:
     pip install qtpy PyQt5 numpy   # (or PySide6 instead of PyQt5)
+    pip install numba              # optional, JIT-compiles compute_dual_batch (imported lazily)
 
 Run:
     python parachute_gui.py
@@ -25,9 +26,11 @@ Run:
 
 from __future__ import annotations
 
+import functools
 import math
+import operator
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import numpy as np
 from qtpy import QtCore, QtGui, QtWidgets
@@ -40,26 +43,30 @@ M_TO_IN   = 39.3701     # 1 m = 39.3701 in
 M_TO_FT   = 3.28084     # 1 m = 3.28084 ft
 PI        = math.pi
 
+# Precomputed factors for D = sqrt(4 S / π) = sqrt(S) * sqrt(4 / π)
+FOUR_OVER_PI   = 4.0 / PI
+SQRT_4_OVER_PI = math.sqrt(FOUR_OVER_PI)
 
-@dataclass
+
+@dataclass(frozen=True)
 class SingleResult:
     S_total_m2: float
     D_total_m: float
 
-    @property
-    def S_total_ft2(self) -> float:
-        return self.S_total_m2 * M2_TO_FT2
-
-    @property
-    def D_total_in(self) -> float:
-        return self.D_total_m * M_TO_IN
+    # Imperial conversions, computed once in __post_init__
+    S_total_ft2: float = field(init=False, repr=False, compare=False)
+    D_total_in: float = field(init=False, repr=False, compare=False)
+    D_total_ft: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def D_total_ft(self) -> float:
-        return self.D_total_m * M_TO_FT
+    def __post_init__(self):
+        # Frozen dataclass: assign derived fields via object.__setattr__
+        setattr_ = object.__setattr__
+        setattr_(self, "S_total_ft2", self.S_total_m2 * M2_TO_FT2)
+        setattr_(self, "D_total_in", self.D_total_m * M_TO_IN)
+        setattr_(self, "D_total_ft", self.D_total_m * M_TO_FT)
 
 
-@dataclass
+@dataclass(frozen=True)
 class DualResult:
     # Totals
     S_total_m2: float
@@ -71,48 +78,38 @@ class DualResult:
     S_main_m2: float
     D_main_m: float
 
-    # Convenience properties
-    @property
-    def S_total_ft2(self) -> float:
-        return self.S_total_m2 * M2_TO_FT2
-
-    @property
-    def D_total_ft(self) -> float:
-        return self.D_total_m * M_TO_FT
-
-    @property
-    def D_total_in(self) -> float:
-        return self.D_total_m * M_TO_IN
-
-    @property
-    def S_drogue_ft2(self) -> float:
-        return self.S_drogue_m2 * M2_TO_FT2
-
-    @property
-    def D_drogue_ft(self) -> float:
-        return self.D_drogue_m * M_TO_FT
-
-    @property
-    def D_drogue_in(self) -> float:
-        return self.D_drogue_m * M_TO_IN
-
-    @property
-    def S_main_ft2(self) -> float:
-        return self.S_main_m2 * M2_TO_FT2
-
-    @property
-    def D_main_ft(self) -> float:
-        return self.D_main_m * M_TO_FT
-
-    @property
-    def D_main_in(self) -> float:
-        return self.D_main_m * M_TO_IN
+    # Imperial conversions, computed once in __post_init__
+    S_total_ft2: float = field(init=False, repr=False, compare=False)
+    D_total_in: float = field(init=False, repr=False, compare=False)
+    D_total_ft: float = field(init=False, repr=False, compare=False)
+    S_drogue_ft2: float = field(init=False, repr=False, compare=False)
+    D_drogue_in: float = field(init=False, repr=False, compare=False)
+    D_drogue_ft: float = field(init=False, repr=False, compare=False)
+    S_main_ft2: float = field(init=False, repr=False, compare=False)
+    D_main_in: float = field(init=False, repr=False, compare=False)
+    D_main_ft: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen dataclass: assign derived fields via object.__setattr__
+        setattr_ = object.__setattr__
+        setattr_(self, "S_total_ft2", self.S_total_m2 * M2_TO_FT2)
+        setattr_(self, "D_total_in", self.D_total_m * M_TO_IN)
+        setattr_(self, "D_total_ft", self.D_total_m * M_TO_FT)
+        setattr_(self, "S_drogue_ft2", self.S_drogue_m2 * M2_TO_FT2)
+        setattr_(self, "D_drogue_in", self.D_drogue_m * M_TO_IN)
+        setattr_(self, "D_drogue_ft", self.D_drogue_m * M_TO_FT)
+        setattr_(self, "S_main_ft2", self.S_main_m2 * M2_TO_FT2)
+        setattr_(self, "D_main_in", self.D_main_m * M_TO_IN)
+        setattr_(self, "D_main_ft", self.D_main_m * M_TO_FT)
 
 
 # -----------------------------
 # Core computations
 # -----------------------------
+# Results are frozen and depend only on the float inputs, so repeated computes
+# with unchanged inputs are served from a small LRU cache.
 
+@functools.lru_cache(maxsize=16)
 def compute_single(g: float, m: float, rho_air: float, Cd: float, V: float) -> SingleResult:
     """Return (S_total, D_total) for a single round canopy.
     S = (2 g m)/(rho C_d V^2),  D = sqrt(4 S / π)
@@ -120,10 +117,11 @@ def compute_single(g: float, m: float, rho_air: float, Cd: float, V: float) -> S
     if any(x <= 0 for x in (g, m, rho_air, Cd, V)):
         raise ValueError("All inputs must be positive.")
     S_total = (2.0 * g * m) / (rho_air * Cd * V * V)
-    D_total = math.sqrt(4.0 * S_total / PI)
+    D_total = math.sqrt(S_total) * SQRT_4_OVER_PI
     return SingleResult(S_total_m2=S_total, D_total_m=D_total)
 
 
+@functools.lru_cache(maxsize=16)
 def compute_dual(
     g: float,
     m: float,
@@ -146,13 +144,13 @@ def compute_dual(
 
     Cd_avg = 0.5 * (Cd_drogue + Cd_main)
     S_total = (2.0 * g * m) / (rho_air * Cd_avg * V * V)
-    D_total = math.sqrt(4.0 * S_total / PI)
+    D_total = math.sqrt(S_total) * SQRT_4_OVER_PI
 
     S_drogue = S_total * drogue_fraction
     S_main   = S_total * (1.0 - drogue_fraction)
 
-    D_drogue = math.sqrt(4.0 * S_drogue / PI)
-    D_main   = math.sqrt(4.0 * S_main   / PI)
+    D_drogue = math.sqrt(S_drogue) * SQRT_4_OVER_PI
+    D_main   = math.sqrt(S_main)   * SQRT_4_OVER_PI
 
     return DualResult(
         S_total_m2=S_total,
@@ -164,6 +162,110 @@ def compute_dual(
     )
 
 
+@dataclass(frozen=True, eq=False)
+class DualBatchResult:
+    """Structure-of-arrays output of compute_dual_batch (one element per case).
+
+    Fields cannot be rebound, but the arrays themselves are writable. Instances
+    compare and hash by identity; compare fields with np.array_equal instead.
+    """
+    S_total_m2: np.ndarray
+    D_total_m: np.ndarray
+    S_drogue_m2: np.ndarray
+    D_drogue_m: np.ndarray
+    S_main_m2: np.ndarray
+    D_main_m: np.ndarray
+
+
+def _dual_kernel(g, m_arr, rho_air, Cd_avg, V_arr, drogue_fraction, sqrt_4_over_pi,
+                 S_total, S_drogue, S_main, D_total, D_drogue, D_main):
+    """Single-pass loop over all cases; only ever run once compiled by Numba."""
+    main_fraction = 1.0 - drogue_fraction
+    for i in range(m_arr.shape[0]):
+        V = V_arr[i]
+        S = (2.0 * g * m_arr[i]) / (rho_air * Cd_avg * V * V)
+        S_d = S * drogue_fraction
+        S_m = S * main_fraction
+        S_total[i] = S
+        S_drogue[i] = S_d
+        S_main[i] = S_m
+        D_total[i] = math.sqrt(S) * sqrt_4_over_pi
+        D_drogue[i] = math.sqrt(S_d) * sqrt_4_over_pi
+        D_main[i] = math.sqrt(S_m) * sqrt_4_over_pi
+
+
+@functools.lru_cache(maxsize=None)
+def _jit_dual_kernel():
+    """Return the Numba-compiled _dual_kernel, or None if Numba is not installed.
+
+    Numba is imported lazily so the GUI, which never sweeps, does not pay its import cost.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_dual_kernel)
+
+
+def compute_dual_batch(
+    g: float,
+    m_arr,
+    rho_air: float,
+    Cd_drogue: float,
+    Cd_main: float,
+    V_arr,
+    drogue_fraction: float = 0.20,
+) -> DualBatchResult:
+    """Vectorised compute_dual for parameter sweeps over mass and/or descent rate.
+
+    m_arr and V_arr are broadcast against each other; every other input is a
+    scalar shared by all cases. Uses a Numba-compiled kernel when available,
+    otherwise whole-array NumPy expressions. Results are equal to compute_dual
+    to within the last floating-point digit.
+    """
+    if any(x <= 0 for x in (g, rho_air, Cd_drogue, Cd_main)):
+        raise ValueError("All inputs must be positive.")
+    if not (0.01 <= drogue_fraction <= 0.9):
+        raise ValueError("Drogue fraction should be in [0.01, 0.90].")
+
+    m_b, V_b = np.broadcast_arrays(np.asarray(m_arr, dtype=np.float64),
+                                   np.asarray(V_arr, dtype=np.float64))
+    shape = m_b.shape
+    m_flat = np.ascontiguousarray(m_b).ravel()
+    V_flat = np.ascontiguousarray(V_b).ravel()
+    if np.any(m_flat <= 0) or np.any(V_flat <= 0):
+        raise ValueError("All inputs must be positive.")
+
+    Cd_avg = 0.5 * (Cd_drogue + Cd_main)
+    kernel = _jit_dual_kernel()
+    if kernel is not None:
+        n = m_flat.shape[0]
+        S_total = np.empty(n)
+        S_drogue = np.empty(n)
+        S_main = np.empty(n)
+        D_total = np.empty(n)
+        D_drogue = np.empty(n)
+        D_main = np.empty(n)
+        kernel(float(g), m_flat, float(rho_air), Cd_avg, V_flat, float(drogue_fraction),
+               SQRT_4_OVER_PI, S_total, S_drogue, S_main, D_total, D_drogue, D_main)
+    else:
+        S_total = (2.0 * g * m_flat) / (rho_air * Cd_avg * V_flat * V_flat)
+        S_drogue = S_total * drogue_fraction
+        S_main = S_total * (1.0 - drogue_fraction)
+        D_total = np.sqrt(S_total) * SQRT_4_OVER_PI
+        D_drogue = np.sqrt(S_drogue) * SQRT_4_OVER_PI
+        D_main = np.sqrt(S_main) * SQRT_4_OVER_PI
+
+    return DualBatchResult(
+        S_total_m2=S_total.reshape(shape),
+        D_total_m=D_total.reshape(shape),
+        S_drogue_m2=S_drogue.reshape(shape),
+        D_drogue_m=D_drogue.reshape(shape),
+        S_main_m2=S_main.reshape(shape),
+        D_main_m=D_main.reshape(shape),
+    )
+
+
 # -----------------------------
 # Utility: rounding helpers
 # -----------------------------
@@ -174,14 +276,16 @@ class FootRounding:
     DOWN = "Floor (whole ft)"
 
 
+_ROUND_FNS = {
+    FootRounding.NEAREST: round,
+    FootRounding.UP: math.ceil,
+    FootRounding.DOWN: math.floor,
+}
+
+
 def round_feet(value_ft: float, mode: str) -> float:
-    if mode == FootRounding.NEAREST:
-        return float(int(round(value_ft)))
-    if mode == FootRounding.UP:
-        return float(int(math.ceil(value_ft)))
-    if mode == FootRounding.DOWN:
-        return float(int(math.floor(value_ft)))
-    return value_ft
+    fn = _ROUND_FNS.get(mode)
+    return float(int(fn(value_ft))) if fn else value_ft
 
 
 # -----------------------------
@@ -199,6 +303,23 @@ class LabeledSpin(QtWidgets.QDoubleSpinBox):
 
 
 class ParachuteGUI(QtWidgets.QWidget):
+    # Stage label -> getter returning (S_m2, S_ft2, D_m, D_in, D_ft) from a result.
+    # Only "Total" exists on SingleResult; all three exist on DualResult.
+    _STAGE_FIELDS = {
+        "Total": operator.attrgetter("S_total_m2", "S_total_ft2", "D_total_m", "D_total_in", "D_total_ft"),
+        "Drogue": operator.attrgetter("S_drogue_m2", "S_drogue_ft2", "D_drogue_m", "D_drogue_in", "D_drogue_ft"),
+        "Main": operator.attrgetter("S_main_m2", "S_main_ft2", "D_main_m", "D_main_in", "D_main_ft"),
+    }
+    STAGES = tuple(_STAGE_FIELDS)
+    COLUMNS = (
+        "Stage",
+        "Area [m²]",
+        "Area [ft²]",
+        "D [m]",
+        "D [in]",
+        "D [ft] (rounded)",
+    )
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Parachute Designer — QtPy")
@@ -275,16 +396,22 @@ class ParachuteGUI(QtWidgets.QWidget):
         self.compute_btn = QtWidgets.QPushButton("Compute")
         self.compute_btn.setDefault(True)
 
-        # Outputs table
-        self.table = QtWidgets.QTableWidget(0, 6)
-        self.table.setHorizontalHeaderLabels([
-            "Stage",
-            "Area [m²]",
-            "Area [ft²]",
-            "D [m]",
-            "D [in]",
-            "D [ft] (rounded)",
-        ])
+        # Outputs table: a fixed pool of items is allocated once; computes only update their text
+        self.table_model = QtGui.QStandardItemModel(len(self.STAGES), len(self.COLUMNS), self)
+        self.table_model.setHorizontalHeaderLabels(list(self.COLUMNS))
+        self._cells: list[list[QtGui.QStandardItem]] = []
+        for row, stage in enumerate(self.STAGES):
+            cells = []
+            for col in range(len(self.COLUMNS)):
+                it = QtGui.QStandardItem()
+                it.setTextAlignment(QtCore.Qt.AlignCenter)
+                self.table_model.setItem(row, col, it)
+                cells.append(it)
+            cells[0].setText(stage)
+            self._cells.append(cells)
+
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.table_model)
         self.table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
         self.table.verticalHeader().setVisible(False)
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
@@ -300,6 +427,7 @@ class ParachuteGUI(QtWidgets.QWidget):
         self.mode_combo.currentTextChanged.connect(self._sync_mode)
         self.compute_btn.clicked.connect(self._on_compute)
         self._sync_mode(self.mode_combo.currentText())
+        self._clear_rows()
 
     # ---- Behaviour ----
     def _sync_mode(self, mode: str):
@@ -311,10 +439,16 @@ class ParachuteGUI(QtWidgets.QWidget):
     def _set_warning(self, text: str | None):
         self.warn_label.setText(text or "")
 
+    def _clear_rows(self):
+        for row in range(len(self.STAGES)):
+            self.table.setRowHidden(row, True)
+
     def _on_compute(self):
         try:
             mode = self.mode_combo.currentText()
             safety = float(self.safety_spin.value())
+            # Diameter scales with sqrt(area), so the safety factor enters as sqrt(safety)
+            sqrt_safety = math.sqrt(safety)
             rounding_mode = self.round_combo.currentText()
             g = float(self.g_spin.value())
             m = float(self.m_spin.value())
@@ -322,18 +456,18 @@ class ParachuteGUI(QtWidgets.QWidget):
             V = float(self.v_spin.value())
 
             self._set_warning(None)
-            self.table.setRowCount(0)
+            self._clear_rows()
 
             if mode == "single":
                 Cd = float(self.cd_spin.value())
                 res = compute_single(g, m, rho, Cd, V)
-                self._populate_single(res, safety, rounding_mode)
+                self._populate_single(res, sqrt_safety, rounding_mode)
             else:
                 Cd_d = float(self.cd_drogue_spin.value())
                 Cd_m = float(self.cd_main_spin.value())
                 f = float(self.drogue_frac_spin.value())
                 res = compute_dual(g, m, rho, Cd_d, Cd_m, V, drogue_fraction=f)
-                self._populate_dual(res, safety, rounding_mode)
+                self._populate_dual(res, sqrt_safety, rounding_mode)
 
             # Advisory if descent speed is high
             if V >= 15.0:
@@ -343,13 +477,11 @@ class ParachuteGUI(QtWidgets.QWidget):
             QtWidgets.QMessageBox.critical(self, "Error", str(exc))
 
     # ---- Table population helpers ----
-    def _add_row(self, stage: str, area_m2: float, diam_m: float, rounding_mode: str, safety: float):
-        area_ft2 = area_m2 * M2_TO_FT2
-        diam_in = diam_m * M_TO_IN
-        diam_ft = diam_m * M_TO_FT
+    def _add_row(self, row: int, res: SingleResult | DualResult, rounding_mode: str, sqrt_safety: float):
+        area_m2, area_ft2, diam_m, diam_in, diam_ft = self._STAGE_FIELDS[self.STAGES[row]](res)
 
-        # Safety-factored diameter is based on diameter scaling with sqrt(area) => multiply by sqrt(safety)
-        diam_ft_sf = diam_ft * math.sqrt(safety)
+        # Safety-factored diameter (sqrt(safety) is precomputed once per compute)
+        diam_ft_sf = diam_ft * sqrt_safety
 
         # Apply rounding for purchase size in feet if ≥ 1 ft; otherwise show inches rounded to whole inch
         rounded_display = ""
@@ -357,30 +489,24 @@ class ParachuteGUI(QtWidgets.QWidget):
             diam_ft_purchase = round_feet(diam_ft_sf, rounding_mode)
             rounded_display = f"{diam_ft_purchase:.0f} ft"
         else:
-            inches_purchase = round(diam_in * math.sqrt(safety))
+            inches_purchase = round(diam_in * sqrt_safety)
             rounded_display = f"< 1 ft (≈ {inches_purchase:.0f} in)"
 
-        r = self.table.rowCount()
-        self.table.insertRow(r)
-        def item(text: str) -> QtWidgets.QTableWidgetItem:
-            it = QtWidgets.QTableWidgetItem(text)
-            it.setTextAlignment(QtCore.Qt.AlignCenter)
-            return it
-
-        self.table.setItem(r, 0, item(stage))
-        self.table.setItem(r, 1, item(f"{area_m2:.3f}"))
-        self.table.setItem(r, 2, item(f"{area_ft2:.3f}"))
-        self.table.setItem(r, 3, item(f"{diam_m:.3f}"))
-        self.table.setItem(r, 4, item(f"{diam_in:.1f}"))
-        self.table.setItem(r, 5, item(rounded_display))
-
-    def _populate_single(self, res: SingleResult, safety: float, rounding_mode: str):
-        self._add_row("Total", res.S_total_m2, res.D_total_m, rounding_mode, safety)
-
-    def _populate_dual(self, res: DualResult, safety: float, rounding_mode: str):
-        self._add_row("Total", res.S_total_m2, res.D_total_m, rounding_mode, safety)
-        self._add_row("Drogue", res.S_drogue_m2, res.D_drogue_m, rounding_mode, safety)
-        self._add_row("Main", res.S_main_m2, res.D_main_m, rounding_mode, safety)
+        cells = self._cells[row]
+        cells[1].setText(f"{area_m2:.3f}")
+        cells[2].setText(f"{area_ft2:.3f}")
+        cells[3].setText(f"{diam_m:.3f}")
+        cells[4].setText(f"{diam_in:.1f}")
+        cells[5].setText(rounded_display)
+        self.table.setRowHidden(row, False)
+
+    def _populate_single(self, res: SingleResult, sqrt_safety: float, rounding_mode: str):
+        self._add_row(0, res, rounding_mode, sqrt_safety)
+
+    def _populate_dual(self, res: DualResult, sqrt_safety: float, rounding_mode: str):
+        self._add_row(0, res, rounding_mode, sqrt_safety)
+        self._add_row(1, res, rounding_mode, sqrt_safety)
+        self._add_row(2, res, rounding_mode, sqrt_safety)
 
 
 def main():